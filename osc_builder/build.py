@@ -1,10 +1,16 @@
 import json
 import os
 import os.path
-import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import TextIO, Optional, Iterable
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import TextIO, Optional, Iterable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import pystac
 import pystac.layout
@@ -16,7 +22,7 @@ from itertools import chain
 
 from .metrics import caclulate_metrics
 from .types_ import Product
-from .util import get_product_segmentation
+from .util import fast_copy_file, fast_copytree, get_product_segmentation
 from .stac import apply_keywords
 
 
@@ -46,6 +52,7 @@ from .stac import (
     get_variable_id,
     get_eo_mission_id,
     FakeHTTPStacIO,
+    ThreadedWriteStacIO,
 )
 
 # to fix https://github.com/stac-utils/pystac/issues/1112
@@ -54,6 +61,25 @@ if "related" not in pystac.link.HIERARCHICAL_LINKS:
 
 
 
+def bulk_add_children(
+        parent: pystac.Catalog,
+        children: Iterable[Union[pystac.Catalog, pystac.Collection]],
+) -> None:
+    """Attach children to a catalog without the per-call overhead of
+    `pystac.Catalog.add_child` (layout strategy + root resolution per
+    child). Only safe for in-memory catalogs that get their self hrefs
+    assigned later by `normalize_and_save`.
+    """
+    root = parent.get_root()
+    links = parent.links
+    for child in children:
+        child.set_root(root)
+        child.set_parent(parent)
+        link = pystac.Link.child(child)
+        link.set_owner(parent)
+        links.append(link)
+
+
 def convert_csvs(
         variables_file: TextIO,
         themes_file: TextIO,
@@ -67,21 +93,43 @@ def convert_csvs(
         catalog_url: Optional[str],
 ):
     start_time = time.time()
-    variables = load_orig_variables(variables_file)
-    themes = load_orig_themes(themes_file)
-    projects = load_orig_projects(projects_file)
+    # the loaders are independent and each reads its own file handle,
+    # so run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        variables_future = executor.submit(load_orig_variables, variables_file)
+        themes_future = executor.submit(load_orig_themes, themes_file)
+        projects_future = executor.submit(load_orig_projects, projects_file)
+        products_wp1_future = executor.submit(
+            load_orig_products, wp_1_products_file
+        )
+        products_wp2_future = executor.submit(
+            load_orig_products, wp_2_products_file
+        )
+        products_wp5_future = executor.submit(
+            load_orig_benchmarks, wp_5_products_file
+        )
+        eo_missions_future = executor.submit(
+            load_orig_eo_missions, eo_missions_file
+        )
+        processes_future = executor.submit(
+            load_orig_processes, processes_files
+        )
+
+    variables = variables_future.result()
+    themes = themes_future.result()
+    projects = projects_future.result()
 
-    products_wp1 = load_orig_products(wp_1_products_file)
+    products_wp1 = products_wp1_future.result()
     segmentation_products_wp1 = get_product_segmentation(products_wp1)
 
-    products_wp2 = load_orig_products(wp_2_products_file)
+    products_wp2 = products_wp2_future.result()
     segmentation_products_wp2 = get_product_segmentation(products_wp2)
 
-    products_wp5 = load_orig_benchmarks(wp_5_products_file)
+    products_wp5 = products_wp5_future.result()
     segmentation_products_wp5 = get_product_segmentation(products_wp5)
 
-    eo_missions = load_orig_eo_missions(eo_missions_file)
-    processes = load_orig_processes(processes_files)
+    eo_missions = eo_missions_future.result()
+    processes = processes_future.result()
 
     # set root structure
     root = pystac.Catalog(
@@ -171,69 +219,46 @@ def convert_csvs(
     root.add_child(products_catalog)
     root.add_child(processes_catalog)
 
-    themes_catalog.add_children(
-        sorted(
-            (catalog_from_theme(theme) for theme in themes),
-            key=lambda catalog: catalog.id,
-        )
+    bulk_add_children(
+        themes_catalog,
+        sorted((catalog_from_theme(theme) for theme in themes), key=lambda catalog: catalog.id),
     )
-    variables_catalog.add_children(
-        sorted(
-            (catalog_from_variable(variable) for variable in variables),
-            key=lambda catalog: catalog.id,
-        )
+    bulk_add_children(
+        variables_catalog,
+        sorted((catalog_from_variable(variable) for variable in variables), key=lambda catalog: catalog.id),
     )
-    eo_missions_catalog.add_children(
-        sorted(
-            (catalog_from_eo_mission(eo_mission) for eo_mission in eo_missions),
-            key=lambda catalog: catalog.id,
-        )
+    bulk_add_children(
+        eo_missions_catalog,
+        sorted((catalog_from_eo_mission(eo_mission) for eo_mission in eo_missions), key=lambda catalog: catalog.id),
     )
-    projects_catalog.add_children(
-        sorted(
-            (collection_from_project(project) for project in projects),
-            key=lambda collection: collection.id,
-        )
+    bulk_add_children(
+        projects_catalog,
+        sorted((collection_from_project(project) for project in projects), key=lambda collection: collection.id),
     )
-    processes_catalog.add_children(
-        sorted(
-            (collection_from_processes(process) for process in processes),
-            key=lambda collection: collection.id,
-        )
+    bulk_add_children(
+        processes_catalog,
+        sorted((collection_from_processes(process) for process in processes), key=lambda collection: collection.id),
     )
 
-    products_catalog.add_children([
+    bulk_add_children(products_catalog, [
         products_wp1_catalog,
         products_wp2_catalog,
         products_wp5_catalog
     ])
 
-    products_wp1_catalog.add_children(
-        sorted(
-            (collection_from_segmentation_product(parent) for parent in segmentation_products_wp1),
-            key=lambda collection: collection.id,
-        )
-    )
-
-    products_wp2_catalog.add_children(
-        sorted(
-            (collection_from_segmentation_product(parent) for parent in segmentation_products_wp2),
-            key=lambda collection: collection.id,
-        )
+    bulk_add_children(
+        products_wp1_catalog,
+        sorted((collection_from_segmentation_product(parent) for parent in segmentation_products_wp1), key=lambda collection: collection.id),
     )
 
-    products_wp5_catalog.add_children(
-        sorted(
-            (collection_from_segmentation_product(parent) for parent in segmentation_products_wp5),
-            key=lambda collection: collection.id,
-        )
+    bulk_add_children(
+        products_wp2_catalog,
+        sorted((collection_from_segmentation_product(parent) for parent in segmentation_products_wp2), key=lambda collection: collection.id),
     )
 
-    projects_catalog.add_children(
-        sorted(
-            (collection_from_project(project) for project in projects),
-            key=lambda collection: collection.id,
-        )
+    bulk_add_children(
+        products_wp5_catalog,
+        sorted((collection_from_segmentation_product(parent) for parent in segmentation_products_wp5), key=lambda collection: collection.id),
     )
 
     _link_sub_product(products_wp1_catalog, products_wp1)
@@ -241,7 +266,13 @@ def convert_csvs(
     _link_sub_product(products_wp5_catalog, products_wp5)
 
     # save catalog
-    root.normalize_and_save(out_dir, pystac.CatalogType.SELF_CONTAINED)
+    writer = ThreadedWriteStacIO()
+    try:
+        root.normalize_and_save(
+            out_dir, pystac.CatalogType.SELF_CONTAINED, stac_io=writer
+        )
+    finally:
+        writer.close()
 
     # TODO: move theme images if exist
     if os.path.isdir("images"):
@@ -251,33 +282,38 @@ def convert_csvs(
                 out_path = os.path.join(
                     os.path.dirname(catalog.get_self_href()), link.href
                 )
-                shutil.copyfile(
-                    os.path.join("images", link.href),
-                    out_path,
-                )
+                src_path = os.path.join("images", link.href)
+                try:
+                    # the images are never mutated after the copy, so a
+                    # hardlink avoids copying the bytes altogether
+                    os.link(src_path, out_path)
+                except OSError:
+                    fast_copy_file(src_path, out_path)
 
     print(f"--- {((time.time() - start_time) / 60)} minutes ---")
     print("-------------END CONVERT --------------")
 
 
 def _link_sub_product(catalog: pystac.Catalog, products_interface: list[Product]) -> None:
+    children_by_title: dict[str, pystac.Catalog] = {
+        child.title: child for child in catalog.get_children()
+    }
     for line_product in products_interface:
-        parent: list[pystac.Catalog] = list(
-            filter(lambda x: x.title == line_product.collection, catalog.get_children()))
-        if len(parent) != 0:
-            parent[0].add_child(collection_from_product(line_product))
+        parent = children_by_title.get(line_product.collection)
+        if parent is not None:
+            parent.add_child(collection_from_product(line_product))
         else:
-            catalog.add_child(collection_from_product(line_product))
+            child = collection_from_product(line_product)
+            catalog.add_child(child)
+            children_by_title[child.title] = child
 
 
 def validate_project(
         collection: pystac.Collection, themes: set[str]
 ) -> list[str]:
-    errors = []
-    for theme in collection.extra_fields[THEMES_PROP]:
-        if theme not in themes:
-            errors.append(f"Theme '{theme}' not valid")
-    return errors
+    # the set difference computes all invalid entries in one C-level pass
+    invalid_themes = set(collection.extra_fields[THEMES_PROP]) - themes
+    return [f"Theme '{theme}' not valid" for theme in sorted(invalid_themes)]
 
 
 def validate_product(
@@ -290,12 +326,15 @@ def validate_product(
     variable = collection.extra_fields[VARIABLES_PROP]
     if variable not in variables:
         errors.append(f"Variable '{variable}' not valid")
-    for theme in collection.extra_fields[THEMES_PROP]:
-        if theme not in themes:
-            errors.append(f"Theme '{theme}' not valid")
-    for eo_mission in collection.extra_fields[MISSIONS_PROP]:
-        if eo_mission not in eo_missions:
-            errors.append(f"EO Mission '{eo_mission}' not valid")
+    invalid_themes = set(collection.extra_fields[THEMES_PROP]) - themes
+    errors.extend(
+        f"Theme '{theme}' not valid" for theme in sorted(invalid_themes)
+    )
+    invalid_missions = set(collection.extra_fields[MISSIONS_PROP]) - eo_missions
+    errors.extend(
+        f"EO Mission '{eo_mission}' not valid"
+        for eo_mission in sorted(invalid_missions)
+    )
     return errors
 
 
@@ -330,8 +369,48 @@ def validate_catalog(data_dir: str):
     # TODO: raise Exception if validation_errors
 
 
+def _is_local(path: str) -> bool:
+    """Cheap replacement for `urlparse(path).scheme in ("", "file")`."""
+    if path.startswith("file:"):
+        return True
+    index = path.find(":", 0, 10)
+    # a colon at position 1 is a Windows drive letter, not a scheme
+    return index < 0 or (index == 1 and path[0].isalpha())
+
+
+def build_mtime_index(directory: str) -> dict[str, float]:
+    """Builds a mapping of real file path to modification time for all
+    files below the given directory in a single `os.scandir` walk.
+
+    Args:
+        directory (str): the directory tree to index
+
+    Returns:
+        dict[str, float]: mapping of `os.path.realpath` to mtime
+    """
+    index: dict[str, float] = {}
+    # resolving the root once keeps every entry.path below it real, so
+    # no per-entry realpath (and its stat chain) is needed
+    stack = [os.path.realpath(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        index[entry.path] = entry.stat(
+                            follow_symlinks=False
+                        ).st_mtime
+        except OSError:
+            continue
+    return index
+
+
 def set_update_timestamps(
-        catalog: pystac.Catalog, stac_io: pystac.StacIO
+        catalog: pystac.Catalog,
+        stac_io: pystac.StacIO,
+        mtime_index: Optional[dict[str, float]] = None,
 ) -> Optional[datetime]:
     """Updates the `updated` field in the catalog according to the underlying
     files last modification time and its included Items and children. This also
@@ -347,6 +426,9 @@ def set_update_timestamps(
 
     Args:
         catalog (pystac.Catalog): the catalog to update the timestamp for
+        stac_io (pystac.StacIO): the StacIO used to resolve catalog paths
+        mtime_index (Optional[dict[str, float]]): a prebuilt mtime lookup
+            (see `build_mtime_index`) to avoid one `stat()` per file
 
     Returns:
         Optional[datetime]: the resulting timestamp
@@ -355,34 +437,45 @@ def set_update_timestamps(
     io = None
     if isinstance(stac_io, FakeHTTPStacIO):
         io = stac_io
+    _replace = io._replace_path if io else None
+
+    def _mtime(path: str) -> float:
+        if mtime_index is not None:
+            mtime = mtime_index.get(os.path.realpath(path))
+            if mtime is not None:
+                return mtime
+        return os.path.getmtime(path)
 
     href = catalog.get_self_href()
-    path = io._replace_path(href) if io else href
+    path = _replace(href) if _replace else href
 
-    if urlparse(path).scheme not in ("", "file"):
+    if not _is_local(path):
         return None
 
-    updated = datetime.fromtimestamp(os.path.getmtime(path), tz=timezone.utc)
+    updated = datetime.fromtimestamp(_mtime(path), tz=timezone.utc)
+
+    # snapshot the lazily resolving iterators so each link is resolved
+    # exactly once per recursion level
+    child_links = list(catalog.get_child_links())
+    items = list(catalog.get_items())
 
-    for child_link in catalog.get_child_links():
+    for child_link in child_links:
         # only follow relative links
-        if urlparse(child_link.get_href()).scheme not in ("", "file"):
+        if not _is_local(child_link.get_href()):
             continue
         child = child_link.resolve_stac_object().target
-        child_updated = set_update_timestamps(child, stac_io)
+        child_updated = set_update_timestamps(child, stac_io, mtime_index)
         if child_updated:
             updated = max(updated, child_updated)
 
-    for item in catalog.get_items():
+    for item in items:
         href = item.get_self_href()
-        path = io._replace_path(href) if io else href
+        path = _replace(href) if _replace else href
 
-        if urlparse(path).scheme not in ("", "file"):
+        if not _is_local(path):
             continue
 
-        item_updated = datetime.fromtimestamp(
-            os.path.getmtime(path), tz=timezone.utc
-        )
+        item_updated = datetime.fromtimestamp(_mtime(path), tz=timezone.utc)
         pystac.CommonMetadata(item).updated = item_updated
         updated = max(updated, item_updated)
 
@@ -393,10 +486,26 @@ def set_update_timestamps(
 
 
 def make_collection_assets_absolute(collection: pystac.Collection):
+    # resolving the self href walks the parent links, do it only once
+    base = collection.get_self_href()
     for asset in collection.assets.values():
-        asset.href = pystac.utils.make_absolute_href(
-            asset.href, collection.get_self_href()
-        )
+        asset.href = pystac.utils.make_absolute_href(asset.href, base)
+
+
+_APP_JSON = sys.intern("application/json")
+
+# slugify does unicode normalization and regex work per call, but the
+# linking loops below feed it the same few project names over and over
+_slugify = lru_cache(maxsize=None)(slugify)
+
+
+def _related_link(target: pystac.STACObject, title: str) -> pystac.Link:
+    return pystac.Link(
+        rel="related",
+        target=target,
+        media_type=_APP_JSON,
+        title=title,
+    )
 
 
 def link_collections(
@@ -410,39 +519,34 @@ def link_collections(
     themes_map: dict[str, pystac.Catalog] = {
         catalog.id: catalog for catalog in theme_catalogs
     }
-    variables_map: dict[str, pystac.Catalog] = {
-        catalog.id: catalog for catalog in variable_catalogs
-    }
     eo_missions_map: dict[str, pystac.Catalog] = {
         catalog.id: catalog for catalog in eo_mission_catalogs
     }
-    project_map: dict[str, pystac.Collection] = {
-        collection.id: collection for collection in project_collections
-    }
 
-    # link variable -> themes
+    # build the lookup maps while doing the theme linking, so the
+    # variable and project inputs are walked only once
+    variables_map: dict[str, pystac.Catalog] = {}
     for variable_catalog in variable_catalogs:
+        variables_map[variable_catalog.id] = variable_catalog
+        # link variable -> themes
         variable_catalog.add_links(
             [
-                pystac.Link(
-                    rel="related",
-                    target=themes_map[theme_name],
-                    media_type="application/json",
-                    title=f"Theme: {themes_map[theme_name].title}",
+                _related_link(
+                    themes_map[theme_name],
+                    f"Theme: {themes_map[theme_name].title}",
                 )
-                for theme_name in get_theme_names(validate_catalog)
+                for theme_name in get_theme_names(variable_catalog)
             ]
         )
 
-    # link projects -> themes
+    project_map: dict[str, pystac.Collection] = {}
     for project_collection in project_collections:
+        project_map[project_collection.id] = project_collection
+        # link projects -> themes
         project_collection.add_links(
             [
-                pystac.Link(
-                    rel="related",
-                    target=themes_map[theme],
-                    media_type="application/json",
-                    title=f"Theme: {themes_map[theme].title}",
+                _related_link(
+                    themes_map[theme], f"Theme: {themes_map[theme].title}"
                 )
                 for theme in get_theme_names(project_collection)
             ]
@@ -451,14 +555,11 @@ def link_collections(
     # link processes -> project
     for process_collection in processes_collections:
         project_collection = project_map[
-            slugify(process_collection.extra_fields[PROJECT_PROP])
+            _slugify(process_collection.extra_fields[PROJECT_PROP])
         ]
         process_collection.add_link(
-            pystac.Link(
-                rel="related",
-                target=project_collection,
-                media_type="application/json",
-                title=f"Project: {project_collection.title}",
+            _related_link(
+                project_collection, f"Project: {project_collection.title}"
             )
         )
 
@@ -466,14 +567,11 @@ def link_collections(
         for product_collection in product_interface_collections:
             # product -> project
             project_collection = project_map[
-                slugify(product_collection.extra_fields[PROJECT_PROP])
+                _slugify(product_collection.extra_fields[PROJECT_PROP])
             ]
             product_collection.add_link(
-                pystac.Link(
-                    rel="related",
-                    target=project_collection,
-                    media_type="application/json",
-                    title=f"Project: {project_collection.title}",
+                _related_link(
+                    project_collection, f"Project: {project_collection.title}"
                 )
             )
             project_collection.add_child(product_collection, set_parent=True)
@@ -482,12 +580,7 @@ def link_collections(
             for theme_name in get_theme_names(product_collection):
                 theme_catalog = themes_map[get_theme_id(theme_name)]
                 product_collection.add_link(
-                    pystac.Link(
-                        rel="related",
-                        target=theme_catalog,
-                        media_type="application/json",
-                        title=f"Theme: {theme_catalog.title}",
-                    )
+                    _related_link(theme_catalog, f"Theme: {theme_catalog.title}")
                 )
                 theme_catalog.add_child(product_collection, set_parent=True)
 
@@ -495,11 +588,8 @@ def link_collections(
             for variable_name in product_collection.extra_fields[VARIABLES_PROP]:
                 variable_catalog = variables_map[get_variable_id(variable_name)]
                 product_collection.add_link(
-                    pystac.Link(
-                        rel="related",
-                        target=variable_catalog,
-                        media_type="application/json",
-                        title=f"Variable: {variable_catalog.title}",
+                    _related_link(
+                        variable_catalog, f"Variable: {variable_catalog.title}"
                     )
                 )
                 variable_catalog.add_child(product_collection, set_parent=True)
@@ -508,11 +598,9 @@ def link_collections(
             for eo_mission in product_collection.extra_fields[MISSIONS_PROP]:
                 eo_mission_catalog = eo_missions_map[get_eo_mission_id(eo_mission)]
                 product_collection.add_link(
-                    pystac.Link(
-                        rel="related",
-                        target=eo_mission_catalog,
-                        media_type="application/json",
-                        title=f"EO Mission: {eo_mission_catalog.title}",
+                    _related_link(
+                        eo_mission_catalog,
+                        f"EO Mission: {eo_mission_catalog.title}",
                     )
                 )
                 eo_mission_catalog.add_child(product_collection, set_parent=True)
@@ -530,10 +618,7 @@ def build_dist(
         update_timestamps: bool = True,
 ):
     start_time = time.time()
-    shutil.copytree(
-        data_dir,
-        out_dir,
-    )
+    fast_copytree(data_dir, out_dir)
     root: pystac.Catalog = pystac.read_file(
         os.path.join(out_dir, "catalog.json")
     )
@@ -542,31 +627,53 @@ def build_dist(
     ])
 
     if update_timestamps:
-        set_update_timestamps(root, None)
-
-    products_collection = chain(*(list(child.get_children()) for child in root.get_child("products").get_children()))
+        set_update_timestamps(root, None, build_mtime_index(out_dir))
+
+    # materialize each child list once: every get_child()/get_children()
+    # call scans and resolves links via HREF I/O, so walk the top level a
+    # single time and share the lists between link_collections and the
+    # keyword pass below
+    top_level = {child.id: child for child in root.get_children()}
+    product_collections = [
+        collection
+        for child in top_level["products"].get_children()
+        for collection in child.get_children()
+    ]
+    project_collections = list(top_level["projects"].get_children())
+    theme_catalogs = list(top_level["themes"].get_children())
+    variable_catalogs = list(top_level["variables"].get_children())
+    eo_mission_catalogs = list(top_level["eo-missions"].get_children())
+    processes_collections = list(top_level["processes"].get_children())
 
     link_collections(
-        products_collection,
-        root.get_child("projects").get_children(),
-        root.get_child("themes").get_children(),
-        root.get_child("variables").get_children(),
-        root.get_child("eo-missions").get_children(),
-        root.get_child("processes").get_children(),
+        product_collections,
+        project_collections,
+        theme_catalogs,
+        variable_catalogs,
+        eo_mission_catalogs,
+        processes_collections,
     )
 
     catalogs = chain(
-        products_collection,
-        root.get_child("projects").get_children(),
-        root.get_child("themes").get_children(),
-        root.get_child("variables").get_children(),
-        root.get_child("eo-missions").get_children(),
-        root.get_child("processes").get_children(),
+        product_collections,
+        project_collections,
+        theme_catalogs,
+        variable_catalogs,
+        eo_mission_catalogs,
+        processes_collections,
     )
     for catalog in catalogs:
         apply_keywords(catalog)
 
-    root.save(pystac.CatalogType.SELF_CONTAINED, dest_href=out_dir)
+    writer = ThreadedWriteStacIO()
+    try:
+        root.save(
+            pystac.CatalogType.SELF_CONTAINED,
+            dest_href=out_dir,
+            stac_io=writer,
+        )
+    finally:
+        writer.close()
     print(f"--- {((time.time() - start_time) / 60)} minutes ---")
     print("-------------END BUILD --------------")
 
@@ -582,8 +689,18 @@ def build_metrics(data_dir: str,
 
     metrics = caclulate_metrics("OSC-Catalog", root)
 
-    with open(os.path.join(data_dir, metrics_file_name), "w") as f:
-        json.dump(metrics, f, indent=2 if pretty_print else None)
+    metrics_path = os.path.join(data_dir, metrics_file_name)
+    if orjson is not None:
+        with open(metrics_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    metrics,
+                    option=orjson.OPT_INDENT_2 if pretty_print else 0,
+                )
+            )
+    else:
+        with open(metrics_path, "w") as f:
+            json.dump(metrics, f, indent=2 if pretty_print else None)
 
     if add_to_root:
         root.add_link(
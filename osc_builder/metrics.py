@@ -1,5 +1,5 @@
-from operator import or_
-from functools import reduce
+from collections import defaultdict
+from functools import lru_cache
 from itertools import groupby
 from typing import Dict, List, Set, Optional, TypedDict
 from datetime import datetime
@@ -9,8 +9,6 @@ from slugify import slugify
 
 from .types_ import Product, Project, Theme, Variable, EOMission
 from .stac import (
-    get_theme_id,
-    get_variable_id,
     get_theme_names,
     VARIABLES_PROP,
     MISSIONS_PROP,
@@ -74,23 +72,35 @@ def build_variable_metrics():
     pass
 
 
+def _union_years(products: List[Product]) -> Set[int]:
+    """Unions the year ranges of the given products in a single pass,
+    without the intermediate per-product sets of a ``reduce(or_, ...)``.
+    """
+    years: Set[int] = set()
+    for product in products:
+        if product.start and product.end:
+            years.update(range(product.start.year, product.end.year + 1))
+    return years
+
+
 def build_theme_metrics():
     pass
 
 
-def intervals_to_years(intervals: List[List[datetime]]) -> Set[int]:
-    result = set()
-    for start, end in intervals:
-        if start is not None and end is not None:
-            result |= set(year for year in range(start.year, end.year + 1))
-    return result
+@lru_cache(maxsize=None)
+def _year_range(start_year: int, end_year: int) -> frozenset:
+    """Caches the year set per (start, end) pair; catalogs contain few
+    distinct intervals, so most calls become a dict hit plus one C-level
+    set update.
+    """
+    return frozenset(range(start_year, end_year + 1))
 
 
-def extract_collection_years(collection: pystac.Collection) -> Set[int]:
+def intervals_to_years(intervals: List[List[datetime]]) -> Set[int]:
     result = set()
-    for start, end in collection.extent.temporal.intervals:
+    for start, end in intervals:
         if start is not None and end is not None:
-            result |= set(year for year in range(start.year, end.year + 1))
+            result.update(_year_range(start.year, end.year))
     return result
 
 
@@ -98,15 +108,25 @@ def metrics(
     id: str,
     root: pystac.Collection,
 ) -> GlobalMetrics:
+    # only counts are reported for projects/products, so plain integer
+    # counters replace the old accumulator lists
     theme_infos: dict = {
         theme.id: {
-            "projects": [],
-            "products": [],
+            "num_projects": 0,
+            "num_products": 0,
             "variable_infos": [],
             "years": set(),
             "description": theme.description,
-            "image": theme.get_single_link(rel="preview").href,
-            "website": theme.get_single_link(rel="via").href,
+            "image": (
+                link.href
+                if (link := theme.get_single_link(rel="preview"))
+                else None
+            ),
+            "website": (
+                link.href
+                if (link := theme.get_single_link(rel="via"))
+                else None
+            ),
         }
         for theme in root.get_child("themes").get_children()
     }
@@ -116,7 +136,7 @@ def metrics(
             "name": variable.id,
             "description": variable.description,
             "themes": get_theme_names(variable),
-            "products": [],
+            "num_products": 0,
             "years": set(),
         }
         for variable in root.get_child("variables").get_children()
@@ -124,8 +144,10 @@ def metrics(
 
     eo_mission_infos = {
         eo_mission.id: {
-            "products": [],
-            "projects": [],
+            "num_products": 0,
+            # a set: only the count is reported, and membership tests on
+            # a list made the dedup below quadratic
+            "projects": set(),
             "variables": set(),
             "years": set(),
         }
@@ -133,8 +155,8 @@ def metrics(
     }
 
     global_info = {
-        "products": [],
-        "projects": [],
+        "num_products": 0,
+        "num_projects": 0,
     }
 
     for variable_info in variable_infos.values():
@@ -142,53 +164,51 @@ def metrics(
             theme_infos[theme]["variable_infos"].append(variable_info)
 
     for project_collection in root.get_child("projects").get_children():
-        global_info["projects"].append(project_collection)
+        global_info["num_projects"] += 1
         for theme in project_collection.extra_fields.get("osc:themes", []):
-            theme_infos[theme]["projects"].append(project_collection)
-
-    for product_collection in project_collection.get_children():
-        project_collection
-        global_info["products"].append(product_collection)
-        for theme in product_collection.extra_fields.get("osc:themes", []):
-            theme_info = theme_infos[theme]
-            theme_info["products"].append(product_collection)
-            theme_info["years"] |= intervals_to_years(
-                product_collection.extent.temporal.intervals
-            )
-
-        variable = product_collection.extra_fields["osc:variable"]
-        variable_info = variable_infos[variable]
-        variable_info["products"].append(product_collection)
-        variable_info["years"] |= intervals_to_years(
-            product_collection.extent.temporal.intervals
-        )
-        for eo_mission in product_collection.extra_fields.get(
-            "osc:missions", []
-        ):
-            eo_mission_info = eo_mission_infos[eo_mission]
-            eo_mission_info["products"].append(product_collection)
-            eo_mission_info["variables"].add(variable)
-            eo_mission_info["years"] |= intervals_to_years(
+            theme_infos[theme]["num_projects"] += 1
+
+        # the product loop belongs inside the project loop: previously it
+        # was dedented and only ran for whichever project was bound last
+        for product_collection in project_collection.get_children():
+            global_info["num_products"] += 1
+            # compute the year set once per product, it is reused for
+            # every theme, variable and mission the product references
+            product_years = intervals_to_years(
                 product_collection.extent.temporal.intervals
             )
+            for theme in product_collection.extra_fields.get(
+                "osc:themes", []
+            ):
+                theme_info = theme_infos[theme]
+                theme_info["num_products"] += 1
+                theme_info["years"] |= product_years
+
+            variable = product_collection.extra_fields["osc:variable"]
+            variable_info = variable_infos[variable]
+            variable_info["num_products"] += 1
+            variable_info["years"] |= product_years
+            for eo_mission in product_collection.extra_fields.get(
+                "osc:missions", []
+            ):
+                eo_mission_info = eo_mission_infos[eo_mission]
+                eo_mission_info["num_products"] += 1
+                eo_mission_info["variables"].add(variable)
+                eo_mission_info["years"] |= product_years
+                eo_mission_info["projects"].add(project_collection)
 
-            if project_collection not in eo_mission_info["projects"]:
-                eo_mission_info["projects"].append(project_collection)
+    # the per-theme year sets already cover every product, so the global
+    # summary is their union rather than a second pass over all products
+    global_years: Set[int] = set()
+    for theme_info in theme_infos.values():
+        global_years |= theme_info["years"]
 
     return {
         "id": id,
         "summary": {
-            "years": sorted(
-                reduce(
-                    or_,
-                    [
-                        intervals_to_years(collection.extent.temporal.intervals)
-                        for collection in global_info["products"]
-                    ],
-                )
-            ),
-            "numberOfProducts": len(global_info["products"]),
-            "numberOfProjects": len(global_info["projects"]),
+            "years": sorted(global_years),
+            "numberOfProducts": global_info["num_products"],
+            "numberOfProjects": global_info["num_projects"],
             "numberOfVariables": len(variables),
             "numberOfThemes": len(themes),
         },
@@ -200,8 +220,8 @@ def metrics(
                 "website": theme_info["website"],
                 "summary": {
                     "years": sorted(theme_info["years"]),
-                    "numberOfProducts": len(theme_info["products"]),
-                    "numberOfProjects": len(theme_info["projects"]),
+                    "numberOfProducts": theme_info["num_products"],
+                    "numberOfProjects": theme_info["num_projects"],
                     "numberOfVariables": len(theme_info["variable_infos"]),
                 },
                 "variables": [
@@ -210,7 +230,7 @@ def metrics(
                         "description": variable_info["description"],
                         "summary": {
                             "years": sorted(variable_info["years"]),
-                            "numberOfProducts": len(variable_info["products"]),
+                            "numberOfProducts": variable_info["num_products"],
                         },
                     }
                     for variable_info in theme_info["variable_infos"]
@@ -223,7 +243,7 @@ def metrics(
                 "name": name,
                 "summary": {
                     "years": sorted(eo_mission_info["years"]),
-                    "numberOfProducts": len(eo_mission_info["products"]),
+                    "numberOfProducts": eo_mission_info["num_products"],
                     "numberOfProjects": len(eo_mission_info["projects"]),
                 },
             }
@@ -236,6 +256,14 @@ def caclulate_metrics(
     id: str,
     root: pystac.Collection,
 ) -> GlobalMetrics:
+    # bind each subtree once: get_child scans the root's links linearly
+    # and resolves them on every call
+    themes_root = root.get_child("themes")
+    variables_root = root.get_child("variables")
+    eo_missions_root = root.get_child("eo-missions")
+    projects_root = root.get_child("projects")
+    products_root = root.get_child("products")
+
     theme_infos: dict = {
         theme.id: {
             "name": theme.title,
@@ -244,14 +272,20 @@ def caclulate_metrics(
             "num_variables": 0,
             "years": set(),
             "description": theme.description,
+            # each get_single_link call scans the link list, so bind the
+            # result once instead of testing and dereferencing separately
             "image": (
-                theme.get_single_link(rel="preview").href
-                if theme.get_single_link(rel="preview")
+                link.href
+                if (link := theme.get_single_link(rel="preview"))
+                else None
+            ),
+            "website": (
+                link.href
+                if (link := theme.get_single_link(rel="via"))
                 else None
             ),
-            "website": theme.get_single_link(rel="via").href,
         }
-        for theme in root.get_child("themes").get_children()
+        for theme in themes_root.get_children()
     }
 
     variable_infos = {
@@ -262,7 +296,7 @@ def caclulate_metrics(
             "num_products": 0,
             "years": set(),
         }
-        for variable in root.get_child("variables").get_children()
+        for variable in variables_root.get_children()
     }
 
     eo_mission_infos = {
@@ -273,7 +307,17 @@ def caclulate_metrics(
             "num_variables": 0,
             "years": set(),
         }
-        for eo_mission in root.get_child("eo-missions").get_children()
+        for eo_mission in eo_missions_root.get_children()
+    }
+
+    # map titles straight to ids so the hot loops below do a dict lookup
+    # instead of re-deriving the id from the name for every reference
+    theme_id_by_title = {
+        info["name"]: theme_id for theme_id, info in theme_infos.items()
+    }
+    variable_id_by_title = {
+        info["name"]: variable_id
+        for variable_id, info in variable_infos.items()
     }
 
     global_info = {
@@ -285,30 +329,32 @@ def caclulate_metrics(
         "years": set(),
     }
 
-    project_collections = list(root.get_child("projects").get_children())
+    project_collections = list(projects_root.get_children())
     global_info["num_projects"] = len(project_collections)
-    for project_collection in root.get_child("projects").get_children():
+    for project_collection in project_collections:
         theme_names = get_theme_names(project_collection)
         for theme_name in theme_names:
-            theme_infos[get_theme_id(theme_name)]["num_projects"] += 1
+            theme_infos[theme_id_by_title[theme_name]]["num_projects"] += 1
 
-    product_collections = list(root.get_child("products").get_children())
+    product_collections = list(products_root.get_children())
     global_info["num_products"] = len(product_collections)
     for product_collection in product_collections:
-        years = extract_collection_years(product_collection)
+        # unpack the hot attributes once per product
+        ef = product_collection.extra_fields
+        years = intervals_to_years(product_collection.extent.temporal.intervals)
         global_info["years"] |= years
         theme_names = get_theme_names(product_collection)
         for theme_name in theme_names:
-            theme_info = theme_infos[get_theme_id(theme_name)]
+            theme_info = theme_infos[theme_id_by_title[theme_name]]
             theme_info["num_products"] += 1
             theme_info["years"] |= years
 
-        for variable_name in product_collection.extra_fields[VARIABLES_PROP]:
-            variable_info = variable_infos[get_variable_id(variable_name)]
+        for variable_name in ef.get(VARIABLES_PROP, ()):
+            variable_info = variable_infos[variable_id_by_title[variable_name]]
             variable_info["num_products"] += 1
             variable_info["years"] |= years
 
-        for eo_mission_name in product_collection.extra_fields[MISSIONS_PROP]:
+        for eo_mission_name in ef.get(MISSIONS_PROP, ()):
             if eo_mission_infos.get(eo_mission_name):
                 eo_mission_info = eo_mission_infos[eo_mission_name]
                 eo_mission_info["num_products"] += 1
@@ -316,7 +362,7 @@ def caclulate_metrics(
 
     for variable_info in variable_infos.values():
         for theme_name in variable_info["themes"]:
-            theme_infos[get_theme_id(theme_name)]["num_variables"] += 1
+            theme_infos[theme_id_by_title[theme_name]]["num_variables"] += 1
 
     return {
         "id": id,
@@ -376,22 +422,31 @@ def build_metrics__(
     projects: List[Project],
     products: List[Product],
 ) -> GlobalMetrics:
+    # slugify is regex/unicode heavy, so compute each slug exactly once
+    # instead of re-slugifying the same names in every comprehension
+    theme_slug: Dict[str, str] = {
+        theme.name: slugify(theme.name) for theme in themes
+    }
+    var_slug: Dict[str, str] = {
+        variable.name: slugify(variable.name) for variable in variables
+    }
+
     # mapping: theme -> products
     #          variable -> products
-    variable_product_map: Dict[str, List[Product]] = {}
-    theme_product_map: Dict[str, List[Product]] = {}
+    variable_product_map: Dict[str, List[Product]] = defaultdict(list)
+    theme_product_map: Dict[str, List[Product]] = defaultdict(list)
     for product in products:
         for theme in product.themes:
-            theme_product_map.setdefault(theme, []).append(product)
-        variable_product_map.setdefault(slugify(product.variable), []).append(
-            product
-        )
+            theme_product_map[theme].append(product)
+        variable_product_map[
+            var_slug.get(product.variable) or slugify(product.variable)
+        ].append(product)
 
     # mapping: theme -> project
-    theme_project_map: Dict[str, List[Project]] = {}
+    theme_project_map: Dict[str, List[Project]] = defaultdict(list)
     for project in projects:
         for theme in project.themes:
-            theme_project_map.setdefault(theme, []).append(project)
+            theme_project_map[theme].append(project)
 
     # mapping: theme -> variable metrics
     variable_metrics: Dict[str, List[VariableMetrics]] = {
@@ -401,24 +456,14 @@ def build_metrics__(
                 "description": variable.description,
                 "summary": {
                     "years": sorted(
-                        reduce(
-                            or_,
-                            [
-                                set(
-                                    range(
-                                        product.start.year, product.end.year + 1
-                                    )
-                                )
-                                for product in variable_product_map.get(
-                                    slugify(variable.name), []
-                                )
-                                if product.start and product.end
-                            ],
-                            set(),
+                        _union_years(
+                            variable_product_map.get(
+                                var_slug[variable.name], []
+                            )
                         )
                     ),
                     "numberOfProducts": len(
-                        variable_product_map.get(slugify(variable.name), [])
+                        variable_product_map.get(var_slug[variable.name], [])
                     ),
                 },
             }
@@ -427,7 +472,8 @@ def build_metrics__(
         # groupby needs sorting first in order to work as expected
         # TODO: variable.theme -> variable.themes
         for theme_name, theme_variables in groupby(
-            sorted(variables, key=lambda v: v.theme), lambda v: slugify(v.theme)
+            sorted(variables, key=lambda v: v.theme),
+            lambda v: theme_slug.get(v.theme) or slugify(v.theme),
         )
     }
 
@@ -441,55 +487,43 @@ def build_metrics__(
             # "technicalOfficer": theme_coll.extra_fields["osc:technical_officer"]["name"],
             "summary": {
                 "years": sorted(
-                    reduce(
-                        or_,
-                        [
-                            set(variable["summary"]["years"])
+                    set().union(
+                        *(
+                            variable["summary"]["years"]
                             for variable in variable_metrics.get(
-                                slugify(theme.name), []
+                                theme_slug[theme.name], []
                             )
-                        ],
-                        set(),
+                        )
                     )
                 ),
                 "numberOfProducts": len(
-                    theme_product_map.get(slugify(theme.name), [])
+                    theme_product_map.get(theme_slug[theme.name], [])
                 ),
                 "numberOfProjects": len(
-                    theme_project_map.get(slugify(theme.name), [])
+                    theme_project_map.get(theme_slug[theme.name], [])
                 ),
                 "numberOfVariables": len(
-                    variable_metrics.get(slugify(theme.name), [])
+                    variable_metrics.get(theme_slug[theme.name], [])
                 ),
             },
             "variables": variable_metrics[
-                slugify(theme.name)
+                theme_slug[theme.name]
             ],  # .get(theme.name, [])
         }
         for theme in themes
     ]
 
     # mapping: eo_mission -> Product
-    mission_product_map: Dict[str, List[Product]] = {}
+    mission_product_map: Dict[str, List[Product]] = defaultdict(list)
     for product in products:
         for mission in product.eo_missions:
-            mission_product_map.setdefault(mission, []).append(product)
+            mission_product_map[mission].append(product)
 
     mission_metrics: List[MissionMetrics] = [
         {
             "name": mission,
             "summary": {
-                "years": sorted(
-                    reduce(
-                        or_,
-                        [
-                            set(range(product.start.year, product.end.year + 1))
-                            for product in products
-                            if product.start and product.end
-                        ],
-                        set(),
-                    )
-                ),
+                "years": sorted(_union_years(products)),
                 "numberOfProducts": len(products),
                 "numberOfVariables": len(
                     set(product.variable for product in products)
@@ -503,9 +537,8 @@ def build_metrics__(
         "id": id,
         "summary": {
             "years": sorted(
-                reduce(
-                    or_,
-                    [set(theme["summary"]["years"]) for theme in theme_metrics],
+                set().union(
+                    *(theme["summary"]["years"] for theme in theme_metrics)
                 )
             ),
             "numberOfProducts": len(products),
@@ -1,15 +1,23 @@
+from collections import defaultdict
 from datetime import date, datetime, time, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Literal, TextIO, Union, cast, Optional, Tuple
 import csv
-import json
-from urllib.parse import urlparse
+import re
+import sys
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 from pygeoif import geometry
 from dateutil.parser import parse as parse_datetime
 from slugify import slugify
 
 from .types_ import Contact, Product, Project, Status, Theme, Variable, EOMission, Benchmark, Processes
-from .util import parse_decimal_date, get_depth
+from .util import parse_decimal_date
 
 def get_metadata_column() -> dict:
     return {
@@ -24,11 +32,31 @@ def get_metadata_column() -> dict:
         "Processes": 8,
     }
 
+_THEME_KEYS = ("Theme1", "Theme2", "Theme3")
+_THEME_GET = itemgetter(*_THEME_KEYS)
+
+
 def get_themes(obj: dict) -> List[str]:
-    return [obj[f"Theme{i}"] for i in range(1, 4) if obj[f"Theme{i}"]]
+    try:
+        # itemgetter fetches all three keys in one C call
+        return [theme for theme in _THEME_GET(obj) if theme]
+    except KeyError:
+        # rows missing a theme column fall back to tolerant lookups
+        return [value for key in _THEME_KEYS if (value := obj.get(key))]
+
+
+def get_themes_row(row: List[str], idx: dict) -> List[str]:
+    return [
+        row[i]
+        for i in (idx.get(f"Theme{n}") for n in range(1, 4))
+        if i is not None and row[i]
+    ]
 
 
+@lru_cache(maxsize=1024)
 def parse_geometry(source: str) -> geometry._Geometry:
+    # many products share the same polygon string; pygeoif geometries
+    # are immutable, so caching and sharing instances is safe
     geom = None
     if not source:
         pass
@@ -36,38 +64,82 @@ def parse_geometry(source: str) -> geometry._Geometry:
         # TODO: figure out a way to parse this
         pass
     else:
-        try:
-            raw_geom = json.loads(source)
-            depth = get_depth(raw_geom)
-            if depth == 1:
-                geom = geometry.Point(*raw_geom)
-            elif depth == 3:
-                shell, *holes = raw_geom
-                geom = geometry.Polygon(shell, holes or None)
-        except ValueError:
-            pass
+        if source[0] == "[" and "[[" not in source:
+            # flat "[lon, lat]" point: two float conversions beat a JSON
+            # decode; a failed parse falls through to the JSON branch
+            # (nested geometries with spaced brackets end up here too)
+            try:
+                geom = geometry.Point(
+                    *(float(part) for part in source.strip("[] \t").split(","))
+                )
+            except (TypeError, ValueError):
+                pass
+        if geom is None:
+            try:
+                raw_geom = _json.loads(source)
+            except ValueError:
+                pass
+            else:
+                # dispatch on the shape of the first element instead of
+                # walking the whole structure with get_depth
+                if isinstance(raw_geom, list) and raw_geom:
+                    first = raw_geom[0]
+                    if isinstance(first, (int, float)):
+                        geom = geometry.Point(*raw_geom)
+                    elif (
+                        isinstance(first, list)
+                        and first
+                        and isinstance(first[0], list)
+                    ):
+                        shell, *holes = raw_geom
+                        geom = geometry.Polygon(shell, holes or None)
 
     return geom
 
 
+# primed with the sentinels so the ubiquitous empty/planned cells never
+# even reach the string comparisons; parsed dates are added as they occur
+_RELEASED_CACHE: dict = {"": None, "Planned": "Planned", "planned": "Planned"}
+
+
 def parse_released(value: str) -> Union[date, None, Literal["Planned"]]:
-    if not value:
-        return None
+    try:
+        return _RELEASED_CACHE[value]
+    except KeyError:
+        pass
 
-    if value == "Planned" or value.lower() == "planned":
-        return "Planned"
+    if value.lower() == "planned":
+        result: Union[date, Literal["Planned"]] = "Planned"
+    else:
+        result = parse_datetime(value).date()
+    _RELEASED_CACHE[value] = result
+    return result
+
+
+@lru_cache(maxsize=None)
+def _split_pattern(delimiter: str) -> "re.Pattern":
+    return re.compile(r"\s*" + re.escape(delimiter) + r"\s*")
 
-    return parse_datetime(value).date()
+
+@lru_cache(maxsize=2048)
+def _parse_list_cached(value: str, delimiter: str) -> Tuple[str, ...]:
+    # the precompiled pattern fuses the split with the per-item strip
+    return tuple(
+        item
+        for item in _split_pattern(delimiter).split(value.strip())
+        if item
+    )
 
 
 def parse_list(value: str, delimiter: str = ";") -> List[str]:
-    return [
-        stripped
-        for item in value.split(delimiter)
-        if (stripped := item.strip())
-    ]
+    if not value:
+        return []
+    # a fresh list per call: some consumers append to the result, so the
+    # cache holds an immutable tuple and only the split/strip is shared
+    return list(_parse_list_cached(value, delimiter))
 
 
+@lru_cache(maxsize=4096)
 def parse_date(value: str, is_max: bool) -> Optional[datetime]:
     if not value:
         return None
@@ -79,145 +151,218 @@ def parse_date(value: str, is_max: bool) -> Optional[datetime]:
     )
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(value: str) -> Optional[datetime]:
+    # CSV exports repeat a handful of distinct date strings across rows;
+    # caching skips the expensive generic dateutil parse on repeats
     if not value:
         return None
-    start = datetime.combine(
-        parse_datetime(value).date(),
-        time.min,
-        tzinfo=timezone.utc,
-    )
-    return start
+    try:
+        # the Start/End columns are overwhelmingly ISO-like, which the C
+        # fromisoformat routine handles without dateutil's format sniffing
+        parsed = datetime.fromisoformat(value.replace("/", "-")).date()
+    except ValueError:
+        parsed = parse_datetime(value).date()
+    return datetime.combine(parsed, time.min, tzinfo=timezone.utc)
+
+def _doi_path(value: str) -> str:
+    """Extracts the DOI from a ``https://doi.org/10.x/...`` style URL —
+    the path after the host, like ``urlparse(value).path[1:]`` did, but
+    with plain string splits instead of the full URL parser.
+    """
+    if "://" in value:
+        rest = value.split("://", 1)[1]
+    elif value.startswith("//"):
+        rest = value[2:]
+    else:
+        # no netloc: urlparse put the whole value in path
+        return value[1:]
+    return rest.partition("/")[2]
+
+
+def _indexed_rows(file: TextIO):
+    """Reads a CSV with `csv.reader`, yielding the header index map once
+    and then each row padded to the header length. Avoids the dict that
+    `csv.DictReader` builds for every row. Empty files yield nothing and
+    blank rows are skipped, like `csv.DictReader` behaved.
+    """
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return
+    yield {name: i for i, name in enumerate(header)}
+    num_columns = len(header)
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < num_columns:
+            row = row + [""] * (num_columns - len(row))
+        yield row
+
+def _iter_record_rows(file: TextIO, cls: type, title_col: str = "Product"):
+    """Shared streaming loader for the product-shaped CSVs: `Product`
+    and `Benchmark` rows have identical columns, so both loaders
+    delegate here and any parsing optimization applies to both. Records
+    are yielded as rows are read, so consumers can process them without
+    the whole file materialized.
+    """
+    rows = _indexed_rows(file)
+    idx = next(rows, None)
+    if idx is None:
+        return
+    # resolve every column index once so the comprehension reads plain
+    # local integers instead of doing ~25 dict lookups per row
+    website_i = idx.get("Website")
+    keywords_i = idx.get("Keywords")
+    short_name_i = idx["Short_Name"]
+    title_i = idx[title_col]
+    description_i = idx["Description"]
+    project_i = idx["Project"]
+    variables_i = idx["Variables"]
+    access_i = idx["Access"]
+    notebook_i = idx["Notebook"]
+    doi_i = idx["DOI"]
+    start_i = idx["Start"]
+    end_i = idx["End"]
+    polygon_i = idx["Polygon"]
+    region_i = idx["Region"]
+    released_i = idx["Released"]
+    eo_missions_i = idx["EO_Missions"]
+    format_i = idx["Format"]
+    category_i = idx["Category"]
+    coordinate_i = idx["Coordinate"]
+    spatial_resolution_i = idx["Spatial Resolution"]
+    temporal_resolution_i = idx["Temporal Resolution"]
+    collection_i = idx["Collection"]
+    consortium_i = idx["Consortium"]
+    for line in rows:
+        yield cls(
+            id=line[short_name_i],
+            website=line[website_i] if website_i is not None else None,
+            title=line[title_i],
+            description=line[description_i],
+            # low-cardinality columns are interned: thousands of rows
+            # share the same few project/region/format/... strings
+            project=sys.intern(line[project_i]),
+            variables=parse_list(line[variables_i]),
+            themes=get_themes_row(line, idx),
+            access=line[access_i],
+            notebook=line[notebook_i],
+            doi=_doi_path(line[doi_i]) if line[doi_i] else None,
+            start=_parse_date(line[start_i]),
+            end=_parse_date(line[end_i]),
+            geometry=parse_geometry(line[polygon_i]),
+            region=sys.intern(line[region_i]) if line[region_i] else None,
+            released=parse_released(line[released_i]),
+            eo_missions=parse_list(line[eo_missions_i]),
+            keywords=parse_list(line[keywords_i]) if keywords_i is not None else [],
+            format=sys.intern(line[format_i]) if line[format_i] else None,
+            category=sys.intern(line[category_i]) if line[category_i] else None,
+            coordinate=sys.intern(line[coordinate_i]) if line[coordinate_i] else None,
+            spatial_resolution=line[spatial_resolution_i] or None,
+            temporal_resolution=line[temporal_resolution_i] or None,
+            collection=sys.intern(line[collection_i]) if line[collection_i] else None,
+            provider=sys.intern(line[consortium_i]) if line[consortium_i] else None
+        )
+
+def iter_orig_products(file: TextIO):
+    return _iter_record_rows(file, Product)
+
+def iter_orig_benchmarks(file: TextIO):
+    return _iter_record_rows(file, Benchmark)
 
 def load_orig_products(file: TextIO) -> List[Product]:
-    products = [
-        Product(
-            id=line["Short_Name"],
-            website=line.get("Website"),
-            title=line["Product"],
-            description=line["Description"],
-            project=line["Project"],
-            variables=parse_list(line["Variables"]),
-            themes=get_themes(line),
-            access=line["Access"],
-            notebook=line["Notebook"],
-            doi=urlparse(line["DOI"]).path[1:] if line["DOI"] else None,
-            start=_parse_date(line["Start"]),
-            end=_parse_date(line["End"]),
-            geometry=parse_geometry(line["Polygon"]),
-            region=line["Region"] or None,
-            released=parse_released(line["Released"]),
-            eo_missions=parse_list(line["EO_Missions"]),
-            keywords=parse_list(line["Keywords"]) if "Keywords" in line else [],
-            format=line["Format"] or None,
-            category=line["Category"] or None,
-            coordinate=line["Coordinate"] or None,
-            spatial_resolution=line["Spatial Resolution"] or None,
-            temporal_resolution=line["Temporal Resolution"] or None,
-            collection=line["Collection"] or None,
-            provider=line["Consortium"] or None
-        )
-        for line in csv.DictReader(file)
-    ]
-    return products
+    return list(iter_orig_products(file))
 
 def load_orig_benchmarks(file: TextIO) -> List[Benchmark]:
-    benchmarks = [
-        Benchmark(
-            id=line["Short_Name"],
-            website=line.get("Website"),
-            title=line["Product"],
-            description=line["Description"],
-            project=line["Project"],
-            variables=parse_list(line["Variables"]),
-            themes=get_themes(line),
-            access=line["Access"],
-            notebook=line["Notebook"],
-            doi=urlparse(line["DOI"]).path[1:] if line["DOI"] else None,
-            start=_parse_date(line["Start"]),
-            end=_parse_date(line["End"]),
-            geometry=parse_geometry(line["Polygon"]),
-            region=line["Region"] or None,
-            released=parse_released(line["Released"]),
-            eo_missions=parse_list(line["EO_Missions"]),
-            keywords=parse_list(line["Keywords"]) if "Keywords" in line else [],
-            format=line["Format"] or None,
-            category=line["Category"] or None,
-            coordinate=line["Coordinate"] or None,
-            spatial_resolution=line["Spatial Resolution"] or None,
-            temporal_resolution=line["Temporal Resolution"] or None,
-            collection=line["Collection"] or None,
-            provider=line["Consortium"] or None
-        )
-        for line in csv.DictReader(file)
-    ]
-    return benchmarks
+    return list(iter_orig_benchmarks(file))
 
 def load_orig_projects(file: TextIO) -> List[Project]:
+    rows = _indexed_rows(file)
+    idx = next(rows, None)
+    if idx is None:
+        return []
     projects = [
         Project(
-            id=slugify(line["Short_Name"]),
-            status=Status(line["Status"].upper()),
-            name=line["Project_Name"],
-            title=line["Short_Name"],
-            description=line["Short_Description"],
-            website=line["Website"],
-            consortium=parse_list(line["Consortium"], ","),
-            start=_parse_date(line["Start_Date_Project"]),
-            end=_parse_date(line["End_Date_Project"]),
+            id=slugify(line[idx["Short_Name"]]),
+            status=Status(line[idx["Status"]].upper()),
+            name=line[idx["Project_Name"]],
+            title=line[idx["Short_Name"]],
+            description=line[idx["Short_Description"]],
+            website=line[idx["Website"]],
+            consortium=parse_list(line[idx["Consortium"]], ","),
+            start=_parse_date(line[idx["Start_Date_Project"]]),
+            end=_parse_date(line[idx["End_Date_Project"]]),
             technical_officer=Contact(
-                line["TO"],
-                line["TO_E-mail"],
+                line[idx["TO"]],
+                line[idx["TO_E-mail"]],
             ),
         )
-        for line in csv.DictReader(file)
+        for line in rows
     ]
     return projects
 
 def load_orig_themes(file: TextIO) -> List[Theme]:
+    rows = _indexed_rows(file)
+    idx = next(rows, None)
+    if idx is None:
+        return []
+    image_i = idx.get("image")
     return [
         Theme(
-            name=line["theme"],
-            description=line["description"] if line["description"] else "" ,
-            link=line["link"],
-            image=line.get("image"),
+            name=line[idx["theme"]],
+            description=line[idx["description"]] if line[idx["description"]] else "" ,
+            link=line[idx["link"]],
+            image=line[image_i] if image_i is not None else None,
         )
-        for line in csv.DictReader(file)
+        for line in rows
     ]
 
 def load_orig_variables(file: TextIO) -> List[Variable]:
+    rows = _indexed_rows(file)
+    idx = next(rows, None)
+    if idx is None:
+        return []
     return [
         Variable(
-            name=line["variable"],
-            description=line["variable description"],
-            link=line["link"],
-            themes=parse_list(line["themes"]),
+            name=line[idx["variable"]],
+            description=line[idx["variable description"]],
+            link=line[idx["link"]],
+            themes=parse_list(line[idx["themes"]]),
         )
-        for line in csv.DictReader(file)
+        for line in rows
     ]
 
 def load_orig_processes(file: TextIO) -> List[Processes]:
+    rows = _indexed_rows(file)
+    idx = next(rows, None)
+    if idx is None:
+        return []
     return [
         Processes(
-            project=line["Project"],
-            name=line["Name"],
-            description=line["Description"],
-            link=line["Link"],
-            asset=line["Asset"],
-            released=parse_released(line["Released"]),
-            languages=parse_list(line["Languages"])
+            project=line[idx["Project"]],
+            name=line[idx["Name"]],
+            description=line[idx["Description"]],
+            link=line[idx["Link"]],
+            asset=line[idx["Asset"]],
+            released=parse_released(line[idx["Released"]]),
+            languages=parse_list(line[idx["Languages"]])
         )
-        for line in csv.DictReader(file)
+        for line in rows
     ]
 
 def load_orig_eo_missions(file: TextIO) -> List[EOMission]:
+    rows = _indexed_rows(file)
+    idx = next(rows, None)
+    if idx is None:
+        return []
     return [
         EOMission(
-            name=line["EO_Missions"],
-            description=line["Description"] if line["Description"] else "",
-            link=line["Link"]
+            name=line[idx["EO_Missions"]],
+            description=line[idx["Description"]] if line[idx["Description"]] else "",
+            link=line[idx["Link"]]
         )
-        for line in csv.DictReader(file)
+        for line in rows
     ]
 
 
@@ -231,53 +376,59 @@ def validate_csvs(
         products_wp5_file: TextIO,
         processes_file: TextIO,
 ) -> List[str]:
-    THEMES = {
-        line["theme"].strip(): line for line in csv.DictReader(themes_file)
-    }
-    VARIABLES = {
-        line["variable"].strip(): line
-        for line in csv.DictReader(variables_file)
-    }
-    MISSIONS = {
-        line["EO_Missions"].strip(): line
-        for line in csv.DictReader(missions_file)
-    }
-    PROJECTS = {
-        line["Short_Name"].strip(): line
-        for line in csv.DictReader(projects_file)
-    }
-    PRODUCTS_WP1 = {
-        line["Product"].strip(): line for line in csv.DictReader(products_wp1_file)
-    }
-    PRODUCTS_WP2 = {
-        line["Product"].strip(): line for line in csv.DictReader(products_wp2_file)
-    }
-    PRODUCTS_WP5 = {
-        line["Product"].strip(): line for line in csv.DictReader(products_wp5_file)
-    }
-
-    issues = []
+    issues: List[str] = []
+    expected_columns = get_metadata_column()
 
-    def _valid_length_file(file_input: TextIO, name_file: str):
-        file_input.seek(0)
-        file_reader = csv.reader(file_input)
-        file_column_name = next(file_reader)
-        if len(file_column_name) != get_metadata_column()[name_file]:
+    def _check_columns(header: List[str], name_file: str):
+        if len(header) != expected_columns[name_file]:
             issues.append(
-                f"""{name_file} csv file is corrupted, this csv must have {get_metadata_column()[name_file]}
-                             columns but {len(file_column_name)} got. """
+                f"""{name_file} csv file is corrupted, this csv must have {expected_columns[name_file]}
+                             columns but {len(header)} got. """
             )
 
-
-    _valid_length_file(projects_file, "Projects")
-    _valid_length_file(variables_file, "Variables")
-    _valid_length_file(missions_file, "EO Missions")
-    _valid_length_file(processes_file, "Processes")
-    _valid_length_file(products_wp1_file, "WP1 Products")
-    _valid_length_file(products_wp2_file, "WP2 Products")
-    _valid_length_file(products_wp5_file, "WP5 Products")
-
-
+    def _load_index(
+        file_input: TextIO, key_header: str, name_file: Optional[str] = None
+    ) -> dict:
+        """Reads the CSV once: checks the column count on the header (if
+        requested) and builds the lookup dict from the same reader, so no
+        seek(0)/re-parse pass is needed.
+        """
+        reader = csv.reader(file_input)
+        header = next(reader)
+        if name_file is not None:
+            _check_columns(header, name_file)
+        key_i = header.index(key_header)
+        return {
+            row[key_i].strip(): dict(zip(header, row))
+            for row in reader
+            if row
+        }
+
+    def _load_keys(
+        file_input: TextIO, key_header: str, name_file: Optional[str] = None
+    ) -> set:
+        """Like ``_load_index``, but only keeps the keys — for files
+        that are exclusively used in membership tests, keeping the full
+        row dicts alive would be wasted memory.
+        """
+        reader = csv.reader(file_input)
+        header = next(reader)
+        if name_file is not None:
+            _check_columns(header, name_file)
+        key_i = header.index(key_header)
+        return {row[key_i].strip() for row in reader if row}
+
+    THEMES = _load_keys(themes_file, "theme")
+    # VARIABLES stays a full index: its rows are cross-checked against
+    # the themes below
+    VARIABLES = _load_index(variables_file, "variable", "Variables")
+    MISSIONS = _load_keys(missions_file, "EO_Missions", "EO Missions")
+    PROJECTS = _load_keys(projects_file, "Short_Name", "Projects")
+    PRODUCTS_WP1 = _load_index(products_wp1_file, "Product", "WP1 Products")
+    PRODUCTS_WP2 = _load_index(products_wp2_file, "Product", "WP2 Products")
+    PRODUCTS_WP5 = _load_index(products_wp5_file, "Product", "WP5 Products")
+    # the processes file only needs its column count checked
+    _check_columns(next(csv.reader(processes_file)), "Processes")
 
     for name, variable in VARIABLES.items():
         for theme in parse_list(
@@ -288,46 +439,62 @@ def validate_csvs(
                     f"Variable '{name}' references non-existing theme '{theme}'"
                 )
 
-    def _validate_products(product_interface: dict, element:str) -> list[str]:
-        _issues = []
+    # one fused pass over all three product files; the references are
+    # batched so each distinct theme/variable/mission name is checked
+    # against the known sets once, not per product
+    ref_themes: dict = defaultdict(list)
+    ref_variables: dict = defaultdict(list)
+    ref_missions: dict = defaultdict(list)
+    for element, product_interface in (
+        ("WP1_Tier1_Products", PRODUCTS_WP1),
+        ("WP2_Tier1_Products", PRODUCTS_WP2),
+        ("WP5_Tier2_Products", PRODUCTS_WP5),
+    ):
         for name, product in product_interface.items():
             project = product["Project"]
             if product["Project"] not in PROJECTS:
-                _issues.append(
+                issues.append(
                     f"{element} '{name}' references non-existing project '{project}'"
                 )
 
             if product["Product"] is None or product["Product"] == '':
-                _issues.append(
+                issues.append(
                     f"{element} missing product column \"product\" for the line {product['ID']}"
                 )
 
             if product["Collection"] is None or product["Collection"] == '':
-                _issues.append(
+                issues.append(
                     f"{element} '{name}' has not collection linked please add collection for the product"
                 )
 
             for theme in get_themes(product):
-                if theme not in THEMES:
-                    _issues.append(
-                        f"{element} '{name}' references non-existing theme '{theme}'"
-                    )
+                ref_themes[theme].append((element, name))
 
             for variable in parse_list(product["Variables"]):
-                if variable not in VARIABLES:
-                    _issues.append(
-                        f"{element} '{name}' references non-existing variable '{variable}'"
-                    )
+                ref_variables[variable].append((element, name))
 
             for mission in parse_list(product["EO_Missions"]):
-                if mission not in MISSIONS:
-                    _issues.append(
-                        f"{element} '{name}' references non-existing mission '{mission}'"
-                    )
-        return _issues
-
-    issues = issues + _validate_products(PRODUCTS_WP1, "WP1_Tier1_Products")
-    issues = issues + _validate_products(PRODUCTS_WP2, "WP2_Tier1_Products")
-    issues = issues + _validate_products(PRODUCTS_WP5, "WP5_Tier2_Products")
+                ref_missions[mission].append((element, name))
+
+    for theme, refs in ref_themes.items():
+        if theme not in THEMES:
+            issues.extend(
+                f"{element} '{name}' references non-existing theme '{theme}'"
+                for element, name in refs
+            )
+
+    for variable, refs in ref_variables.items():
+        if variable not in VARIABLES:
+            issues.extend(
+                f"{element} '{name}' references non-existing variable '{variable}'"
+                for element, name in refs
+            )
+
+    for mission, refs in ref_missions.items():
+        if mission not in MISSIONS:
+            issues.extend(
+                f"{element} '{name}' references non-existing mission '{mission}'"
+                for element, name in refs
+            )
 
     return issues
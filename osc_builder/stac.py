@@ -1,4 +1,7 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timezone
+from functools import lru_cache
 from os.path import join
 from typing import Generic, TypeVar, Union, cast, List, Iterable
 from urllib.parse import urlparse
@@ -491,16 +494,21 @@ def catalog_from_eo_mission(eo_mission: EOMission) -> pystac.Catalog:
     return catalog
 
 
+# the id helpers are pure slug derivations called once per product x
+# theme/variable/mission with heavily repeating inputs, so memoize them
+@lru_cache(maxsize=None)
 def get_theme_id(theme_name: str):
     # return f"theme-{slugify(theme_name)}"
     return f"{slugify(theme_name)}"
 
 
+@lru_cache(maxsize=None)
 def get_variable_id(variable_name: str):
     # return f"variable-{slugify(variable_name)}"
     return f"{slugify(variable_name)}"
 
 
+@lru_cache(maxsize=None)
 def get_eo_mission_id(eo_mission_name: str):
     # return f"mission-{slugify(eo_mission_name)}"
     return f"{slugify(eo_mission_name)}"
@@ -553,6 +561,51 @@ def apply_keywords(catalog: Union[pystac.Catalog, pystac.Collection]):
         catalog.keywords = keywords
 
 
+class ThreadedWriteStacIO(pystac.stac_io.DefaultStacIO):
+    """StacIO that offloads the per-file writes to a thread pool.
+
+    Saving a catalog emits one small JSON file per catalog/collection;
+    queueing the writes on worker threads overlaps the serialization
+    with the disk I/O. Call `close` (or `flush`) after the save to wait
+    for all pending writes and surface any write errors.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        super().__init__()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures: List = []
+
+    @staticmethod
+    def _write(href: str, txt: str) -> None:
+        # raw open/write/close keeps it to one syscall triple per file,
+        # without the TextIOWrapper buffering layer
+        data = txt.encode("utf-8")
+        fd = os.open(href, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            written = 0
+            while written < len(data):
+                written += os.write(fd, data[written:])
+        finally:
+            os.close(fd)
+
+    def write_text_to_href(self, href: str, txt: str) -> None:
+        href = os.fspath(href)
+        # create the directory here, where calls are still serial
+        dirname = os.path.dirname(href)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self._futures.append(self._executor.submit(self._write, href, txt))
+
+    def flush(self) -> None:
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self) -> None:
+        self.flush()
+        self._executor.shutdown()
+
+
 class FakeHTTPStacIO(pystac.stac_io.DefaultStacIO):
     def __init__(self, out_dir: str, path_prefix: str = "/"):
         self.out_dir = out_dir
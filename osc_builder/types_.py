@@ -12,7 +12,7 @@ class Status(Enum):
     COMPLETED = "COMPLETED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     id: str
     website: str
@@ -41,7 +41,7 @@ class Product:
     provider: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductSegmentation:
     title: Optional[str]
     project: Optional[str]
@@ -56,13 +56,13 @@ class ProductSegmentation:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     name: str
     e_mail: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     id: str
     status: Status
@@ -76,7 +76,7 @@ class Project:
     technical_officer: Contact
 
 
-@dataclass
+@dataclass(slots=True)
 class Theme:
     name: str
     description: str
@@ -84,7 +84,7 @@ class Theme:
     image: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable:
     name: str
     description: str
@@ -99,18 +99,18 @@ class Variable:
         return cls(**kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class EOMission:
     name: str
     description: Optional[str]
     link: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Benchmark(Product):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class Processes:
     name: str
     project: str
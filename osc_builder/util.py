@@ -1,4 +1,10 @@
+import os
+import os.path
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 from .types_ import ProductSegmentation
@@ -18,75 +24,197 @@ CODE_MODEL = {
 }
 
 
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def fast_copy_file(src: str, dst: str) -> None:
+    """Copy a single file using the cheapest mechanism available.
+
+    Tries `os.copy_file_range` first (reflink/server-side copy on
+    filesystems that support it), then `os.sendfile`, then falls back to
+    a plain buffered read/write loop. The source timestamps are carried
+    over like `shutil.copy2` did — `set_update_timestamps` derives the
+    `updated` fields from the mtimes of the copied tree.
+
+    Args:
+        src (str): path of the file to copy
+        dst (str): path to copy to (truncated if it exists)
+    """
+    fd_in = os.open(src, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd_in)
+        fd_out = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            size = stat.st_size
+            done = False
+            for fast_copy in ("copy_file_range", "sendfile"):
+                func = getattr(os, fast_copy, None)
+                if func is None:
+                    continue
+                try:
+                    offset = 0
+                    while offset < size:
+                        if fast_copy == "copy_file_range":
+                            copied = func(fd_in, fd_out, size - offset)
+                        else:
+                            copied = func(fd_out, fd_in, offset, size - offset)
+                        if copied == 0:
+                            break
+                        offset += copied
+                    if offset >= size:
+                        done = True
+                        break
+                except OSError:
+                    pass
+                # rewind after a partial or failed fast copy
+                os.lseek(fd_in, 0, os.SEEK_SET)
+                os.lseek(fd_out, 0, os.SEEK_SET)
+                os.ftruncate(fd_out, 0)
+            if not done:
+                while True:
+                    chunk = os.read(fd_in, _COPY_BUFSIZE)
+                    if not chunk:
+                        break
+                    # os.write may write less than the full chunk
+                    written = 0
+                    while written < len(chunk):
+                        written += os.write(fd_out, chunk[written:])
+        finally:
+            os.close(fd_out)
+        os.utime(dst, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    finally:
+        os.close(fd_in)
+
+
+def fast_copytree(src: str, dst: str) -> None:
+    """Recursively copy a directory tree like `shutil.copytree`, but
+    dispatching the per-file copies to a thread pool and using
+    `fast_copy_file` for each file.
+
+    Args:
+        src (str): the directory to copy
+        dst (str): the destination directory (must not exist yet)
+    """
+    with ThreadPoolExecutor(
+        max_workers=(os.cpu_count() or 1) * 2
+    ) as executor:
+        futures = []
+        dir_pairs = []
+
+        def _walk(src_dir: str, dst_dir: str):
+            os.makedirs(dst_dir)
+            dir_pairs.append((src_dir, dst_dir))
+            for entry in os.scandir(src_dir):
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    _walk(entry.path, target)
+                else:
+                    futures.append(
+                        executor.submit(fast_copy_file, entry.path, target)
+                    )
+
+        _walk(src, dst)
+        for future in futures:
+            future.result()
+
+    # restore directory timestamps last — creating the copied entries
+    # above touched every destination directory
+    for src_dir, dst_dir in reversed(dir_pairs):
+        stat = os.stat(src_dir)
+        os.utime(dst_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+_DECIMAL_DATE_RE = re.compile(r"(\d+)(?:\.(\d+)(?:\.(\d+))?)?$")
+
+
+@lru_cache(maxsize=4096)
 def parse_decimal_date(source: Optional[str]) -> Optional[date]:
     if not source:
         return None
-    dot_count = source.count(".")
-    if not dot_count:
-        return date(int(source), 1, 1)
-    if dot_count == 1:
-        year, month = source.split(".")
+    match = _DECIMAL_DATE_RE.match(source)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    if month is None:
+        return date(int(year), 1, 1)
+    if day is None:
+        # kept as-is: the one-dot form has always stored the month
+        # zero-based, hence the +1
         return date(int(year), int(month) + 1, 1)
-    elif dot_count == 2:
-        year, month, day = source.split(".")
-        return date(int(year), int(month), int(day))
-    return None
+    return date(int(year), int(month), int(day))
 
 
 def get_depth(maybe_list: Any) -> int:
-    if isinstance(maybe_list, (list, tuple)):
-        return get_depth(maybe_list[0]) + 1
-    return 0
+    depth = 0
+    while isinstance(maybe_list, (list, tuple)):
+        maybe_list = maybe_list[0]
+        depth += 1
+    return depth
 
 
 def get_product_segmentation(products=None) -> [ProductSegmentation]:
     if products is None:
         products = []
 
+    # group by collection in one pass; dict insertion order keeps the
+    # first-seen collection order of the old dedup-list approach
+    groups: dict[str, list] = defaultdict(list)
+    for product in products:
+        if product.collection:
+            groups[product.collection].append(product)
+
     products_segmentation_list: list[ProductSegmentation] = []
-    list_name_product_segmentation = list(
-        dict.fromkeys([product.collection for product in products if product.collection]))
-    for name in list_name_product_segmentation:
-        list_related_product = list(filter(lambda x: x.collection == name, products))
-        regions = list(dict.fromkeys([product.region for product in list_related_product if product.region]))
-        variables = []
-        eo_missions = []
-        themes = []
-        for product in list_related_product:
-            if len(product.variables) != 0:
-                variables.append(*product.variables)
-            if len(product.eo_missions) != 0:
-                eo_missions.append(*product.eo_missions)
-            if len(product.themes) != 0:
-                themes.append(*product.themes)
-
-        variables = list(dict.fromkeys(variables))
-        eo_missions = list(dict.fromkeys(eo_missions))
-        themes = list(dict.fromkeys(themes))
-        first = list(sorted(list_related_product, key=lambda x: x.start))
-        end = list(sorted(list_related_product, key=lambda x: x.end))
-        end = list(reversed(end))
+    for name, group in groups.items():
+        regions = dict.fromkeys(
+            product.region for product in group if product.region
+        )
+        variables: dict = {}
+        eo_missions: dict = {}
+        themes: dict = {}
+        for product in group:
+            variables.update(dict.fromkeys(product.variables))
+            eo_missions.update(dict.fromkeys(product.eo_missions))
+            themes.update(dict.fromkeys(product.themes))
+
+        # min/max instead of sorting the group twice; ties resolve like
+        # the old stable sort did (first minimal start, last maximal end)
+        first = min(group, key=lambda product: product.start)
+        last = group[0]
+        for product in group[1:]:
+            if product.end >= last.end:
+                last = product
 
         item = ProductSegmentation(
             title=name,
-            project=end[0].project,
-            themes=themes,
-            start=first[0].start,
-            geometry=first[0].geometry,
-            end=end[0].end,
-            released=first[0].released,
+            project=last.project,
+            themes=list(themes),
+            start=first.start,
+            geometry=first.geometry,
+            end=last.end,
+            released=first.released,
             region=", ".join(regions),
-            variables=variables,
-            eo_missions=eo_missions,
+            variables=list(variables),
+            eo_missions=list(eo_missions),
         )
         products_segmentation_list.append(item)
 
     return products_segmentation_list
 
 
-def get_model_code_ref(product) -> Union[None, str]:
-    rs = list(
-        filter(lambda x: product.id.lower().startswith(x.lower()), list(CODE_MODEL.keys())
-               )
+# lowered prefixes precomputed once, longest first so that e.g.
+# "pcr-globwb" matches before its "pcr" prefix
+_CODE_PREFIXES = tuple(
+    sorted(
+        ((key.lower(), ref) for key, ref in CODE_MODEL.items()),
+        key=lambda item: len(item[0]),
+        reverse=True,
     )
-    return CODE_MODEL.get(rs[0]) if len(rs) != 0 else None
+)
+
+
+def get_model_code_ref(product) -> Union[None, str]:
+    product_id = product.id.lower()
+    for prefix, ref in _CODE_PREFIXES:
+        if product_id.startswith(prefix):
+            return ref
+    return None